@@ -1,18 +1,54 @@
 # api/index.py
 from http.server import BaseHTTPRequestHandler
-import json
+import hashlib
+import logging
 import sys
+from collections import defaultdict
 from pathlib import Path
 from urllib.parse import urlparse
-from io import BytesIO
-import asyncio
 
 # Add backend to path
 root = Path(__file__).resolve().parent.parent
 sys.path.append(str(root / "backend"))
 
+from utils.serialization import dumps, loads
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+)
+
+# Question fields copied into each calculated row, in response order
+_ROW_KEYS = (
+    "sdg_number",
+    "sdg_description",
+    "sdg_target",
+    "sustainability_dimension",
+    "kpi",
+    "question",
+    "sector",
+)
+
+_SCORE_DESCRIPTIONS = {
+    0: "N/A",
+    1: "Issue identified, but no plans for further actions",
+    2: "Issue identified, starts planning further actions",
+    3: "Action plan with clear targets and deadlines in place",
+    4: "Action plan operational - some progress in established targets",
+    5: "Action plan operational - achieving the target set"
+}
+
+# The bundled template is identical for every caller, so let browsers and the edge reuse it
+_DEFAULT_TEMPLATE_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+_UPLOADED_TEMPLATE_CACHE_CONTROL = "no-cache"
+
+
 class handler(BaseHTTPRequestHandler):
+    # Every response carries a Content-Length, so the connection can be reused
+    protocol_version = "HTTP/1.1"
+    
     def do_GET(self):
+        self.ignore_body()
         parsed = urlparse(self.path)
         path = parsed.path
         
@@ -22,40 +58,26 @@ class handler(BaseHTTPRequestHandler):
         
         if path == '/api/questionnaire/template':
             try:
-                # Direct implementation instead of calling async function
                 from utils.cache import questionnaire_cache
-                from parsers.excel_parser import extract_questions_for_interactive
-                import os
                 
                 # Try to get cached data
                 cached_data = questionnaire_cache.get_data()
                 
                 if cached_data:
                     result = {**cached_data, "source": "uploaded"}
+                    cache_control = _UPLOADED_TEMPLATE_CACHE_CONTROL
                 else:
-                    # Load from default file
-                    default_file = os.path.join("backend", "data", "final.xlsx")
+                    # Load the bundled default questionnaire
+                    from utils.default_template import load_default_template
                     
-                    if not os.path.exists(default_file):
-                        default_file = os.path.join("data", "final.xlsx")
+                    template = load_default_template()
                     
-                    if not os.path.exists(default_file):
+                    if template is None:
                         self.send_error_json("No questionnaire available")
                         return
                     
-                    all_questions = []
-                    last_sector = "General"
-                    
-                    for sheet_name in ["Textile_revised", "Fertilizer_revised", "Packaging_revised"]:
-                        try:
-                            sheet_result = extract_questions_for_interactive(default_file, sheet_name)
-                            if sheet_result.get("questions"):
-                                all_questions.extend(sheet_result["questions"])
-                                last_sector = sheet_result.get("sector", last_sector)
-                        except:
-                            continue
-                    
-                    questionnaire_cache.set_data(all_questions, last_sector)
+                    all_questions = template["questions"]
+                    last_sector = template["sector"]
                     
                     result = {
                         "success": True,
@@ -64,8 +86,9 @@ class handler(BaseHTTPRequestHandler):
                         "total_questions": len(all_questions),
                         "source": "default"
                     }
+                    cache_control = _DEFAULT_TEMPLATE_CACHE_CONTROL
                 
-                self.send_json(result)
+                self.send_json(result, cache_control=cache_control)
                 return
                 
             except Exception as e:
@@ -84,40 +107,28 @@ class handler(BaseHTTPRequestHandler):
             try:
                 # Get content type and length
                 content_type = self.headers.get('Content-Type', '')
-                content_length = int(self.headers.get('Content-Length', 0))
+                content_length = self.body_length() or 0
                 
                 if 'multipart/form-data' not in content_type:
+                    # The body was never read, so don't reuse the connection
+                    self.close_connection = True
                     self.send_error_json("Content-Type must be multipart/form-data", status=400)
                     return
                 
-                # Read body
-                body = self.rfile.read(content_length)
-                
-                # Parse multipart data
-                boundary = content_type.split('boundary=')[1].encode()
-                parts = body.split(b'--' + boundary)
+                # Stream the file part straight into a spooled temp file
+                excel_file = self.read_upload_file(content_type, content_length)
                 
-                file_data = None
-                for part in parts:
-                    if b'Content-Disposition' in part and b'filename=' in part:
-                        # Extract file data (after headers)
-                        file_content = part.split(b'\r\n\r\n', 1)
-                        if len(file_content) > 1:
-                            file_data = file_content[1].rstrip(b'\r\n')
-                            break
-                
-                if not file_data:
+                if excel_file is None:
+                    # Nothing (or not all) of the body may have been read, e.g. without a boundary
+                    self.close_connection = True
                     self.send_error_json("No file found in request", status=400)
                     return
                 
-                # Process file
-                from parsers.excel_parser import extract_questions_for_interactive
+                # Process file; re-uploads of an identical workbook reuse the earlier parse
                 from utils.cache import questionnaire_cache
                 
-                excel_file = BytesIO(file_data)
-                excel_file.seek(0)
-                
-                result = extract_questions_for_interactive(excel_file, None)
+                with excel_file:
+                    result = questionnaire_cache.parse_upload(excel_file)
                 
                 if not result.get("questions"):
                     self.send_error_json("No questions found in Excel file", status=400)
@@ -143,15 +154,17 @@ class handler(BaseHTTPRequestHandler):
                 import traceback
                 error_trace = traceback.format_exc()
                 print(f"Upload error:\n{error_trace}")
+                # Part of the body may still be unread
+                self.close_connection = True
                 self.send_error_json(f"Upload failed: {str(e)}")
                 return
         
         if path == '/api/questionnaire/calculate':
             try:
                 # Read JSON body
-                content_length = int(self.headers.get('Content-Length', 0))
+                content_length = self.body_length() or 0
                 body = self.rfile.read(content_length)
-                data = json.loads(body.decode('utf-8'))
+                data = loads(body)
                 
                 # Direct implementation instead of calling async function
                 responses = data.get('responses', [])
@@ -160,40 +173,15 @@ class handler(BaseHTTPRequestHandler):
                 # Map responses by question_id
                 response_map = {r['question_id']: r['score'] for r in responses}
                 
-                # Build rows with scores
-                rows = []
+                # Build rows with scores, grouped by sector in the same pass
+                sector_groups = defaultdict(list)
                 for q in questions:
-                    q_id = q.get("id")
-                    score = response_map.get(q_id, 0)
+                    score = response_map.get(q.get("id"), 0)
                     
-                    score_descriptions = {
-                        0: "N/A",
-                        1: "Issue identified, but no plans for further actions",
-                        2: "Issue identified, starts planning further actions",
-                        3: "Action plan with clear targets and deadlines in place",
-                        4: "Action plan operational - some progress in established targets",
-                        5: "Action plan operational - achieving the target set"
-                    }
-                    
-                    rows.append({
-                        "sdg_number": q.get("sdg_number"),
-                        "sdg_description": q.get("sdg_description"),
-                        "sdg_target": q.get("sdg_target"),
-                        "sustainability_dimension": q.get("sustainability_dimension"),
-                        "kpi": q.get("kpi"),
-                        "question": q.get("question"),
-                        "sector": q.get("sector"),
-                        "score": score,
-                        "score_description": score_descriptions.get(score, "Unknown")
-                    })
-                
-                # Group by sector
-                sector_groups = {}
-                for row in rows:
-                    sector = row.get("sector", "Unknown")
-                    if sector not in sector_groups:
-                        sector_groups[sector] = []
-                    sector_groups[sector].append(row)
+                    row = {key: q.get(key) for key in _ROW_KEYS}
+                    row["score"] = score
+                    row["score_description"] = _SCORE_DESCRIPTIONS.get(score, "Unknown")
+                    sector_groups[row["sector"]].append(row)
                 
                 result = {
                     "success": True,
@@ -209,25 +197,156 @@ class handler(BaseHTTPRequestHandler):
             except Exception as e:
                 import traceback
                 print(f"Calculate error:\n{traceback.format_exc()}")
+                # Part of the body may still be unread
+                self.close_connection = True
                 self.send_error_json(f"Calculate failed: {str(e)}")
                 return
         
+        self.close_connection = True
         self.send_json({"error": "Not found"}, status=404)
     
     def do_OPTIONS(self):
+        self.ignore_body()
         # CORS preflight
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
+        self.send_connection_header()
         self.end_headers()
     
-    def send_json(self, data, status=200):
+    def body_length(self):
+        """Declared Content-Length of the request body.
+        
+        Returns None when the body can't be delimited (no or invalid Content-Length, or a
+        Transfer-Encoding); the connection is then closed after the response, since
+        unread body bytes would otherwise be parsed as the next request.
+        """
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            length = -1
+        if length < 0 or 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            return None
+        return length
+    
+    def ignore_body(self):
+        """GET and OPTIONS never read a body; if one was sent, close after the response
+        instead of parsing it as the next request."""
+        if 'Content-Length' in self.headers or 'Transfer-Encoding' in self.headers:
+            if self.body_length() != 0:
+                self.close_connection = True
+    
+    def read_upload_file(self, content_type, content_length):
+        """Stream the first file part of a multipart body into a spooled temp file.
+        
+        Returns the spool rewound to the start, or None if the body has no file part.
+        Unless the whole body was read up to the closing boundary, the connection is
+        marked to close after the response.
+        """
+        from tempfile import SpooledTemporaryFile
+        from multipart.multipart import MultipartParser, parse_options_header
+        
+        _, params = parse_options_header(content_type)
+        boundary = params.get(b'boundary')
+        if not boundary:
+            # The body can't be split into parts, so none of it is read
+            self.close_connection = True
+            return None
+        
+        spool = SpooledTemporaryFile(max_size=1024 * 1024)
+        state = {"field": b"", "value": b"", "in_file": False, "done": False, "size": 0, "end": False}
+        
+        def on_part_begin():
+            state["in_file"] = False
+        
+        def on_header_field(data, start, end):
+            state["field"] += data[start:end]
+        
+        def on_header_value(data, start, end):
+            state["value"] += data[start:end]
+        
+        def on_header_end():
+            if state["field"].lower() == b'content-disposition':
+                _, disposition = parse_options_header(state["value"])
+                state["in_file"] = not state["done"] and b'filename' in disposition
+            state["field"], state["value"] = b"", b""
+        
+        def on_part_data(data, start, end):
+            if state["in_file"]:
+                spool.write(data[start:end])
+                state["size"] += end - start
+        
+        def on_part_end():
+            if state["in_file"]:
+                state["in_file"], state["done"] = False, True
+        
+        def on_end():
+            state["end"] = True
+        
+        parser = MultipartParser(boundary, {
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+            "on_end": on_end,
+        })
+        
+        remaining = content_length
+        while remaining > 0:
+            chunk = self.rfile.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            parser.write(chunk)
+            remaining -= len(chunk)
+        parser.finalize()
+        
+        if remaining or not state["end"]:
+            # Short body, or a declared length that stops before the closing boundary
+            self.close_connection = True
+        
+        if not state["size"]:
+            spool.close()
+            return None
+        
+        spool.seek(0)
+        return spool
+    
+    def send_json(self, data, status=200, cache_control=None):
+        payload = dumps(data)
+        
+        # Cacheable responses carry an ETag and answer a matching If-None-Match with 304
+        etag = None
+        if cache_control:
+            etag = '"%s"' % hashlib.blake2b(payload, digest_size=16).hexdigest()
+            if_none_match = self.headers.get('If-None-Match', '')
+            if any(tag.strip() in (etag, 'W/' + etag, '*') for tag in if_none_match.split(',')):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', cache_control)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_connection_header()
+                self.end_headers()
+                return
+        
         self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_connection_header()
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(payload)
+    
+    def send_connection_header(self):
+        # An HTTP/1.1 connection stays open unless the response says otherwise
+        self.send_header('Connection', 'close' if self.close_connection else 'keep-alive')
     
     def send_error_json(self, message, status=500):
         self.send_json({"error": message}, status=status)
\ No newline at end of file
@@ -1,7 +1,14 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers import upload_excel, questionnaire
 
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+)
+
 app = FastAPI(title="SDG Assessment API")
 
 # CORS Configuration
@@ -31,8 +38,3 @@ async def health_check():
 @app.get("/api/health")
 async def api_health_check():
     return {"status": "healthy", "message": "API is running on Vercel"}
-
-# Vercel serverless handler
-# IMPORTANT: This must be at module level, not inside a function
-from mangum import Mangum
-handler = Mangum(app, lifespan="off")  # ← Add lifespan="off"
\ No newline at end of file
@@ -1,21 +1,33 @@
 # questionnaire_parser.py
 
+import bisect
+import datetime
+import functools
 import logging
+import os
 import re
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple, Union
-from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 import openpyxl
 from openpyxl.utils import get_column_letter
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fall back to difflib
+    fuzz = process = None
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # fall back to openpyxl
+    CalamineWorkbook = None
+
 # ============================== Logging ==============================
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-)
+# Handlers are the application's job (see app.py / api/index.py). INFO by default; raise
+# with logging.getLogger("QuestionnaireParser").setLevel(logging.DEBUG) to trace parsing.
 logger = logging.getLogger("QuestionnaireParser")
+logger.setLevel(logging.INFO)
 
 # ============================== Constants ==============================
 # Canonical SDG descriptions (keep exactly as provided)
@@ -61,6 +73,15 @@ SECTOR_SYNONYMS: Dict[str, str] = {
     "packing": "Packaging",
     "pack": "Packaging",
 }
+_SECTOR_KEYS: List[str] = list(SECTOR_SYNONYMS)
+
+# Sheet-name fragments → sector, checked in order when C3 has no usable sector
+SHEET_NAME_SECTORS: Tuple[Tuple[str, str], ...] = (
+    ("textile", "Textiles"),
+    ("fertilizer", "Fertilizers"),
+    ("fertilis", "Fertilizers"),
+    ("packag", "Packaging"),  # covers packaging/package/packed
+)
 
 # Score rubric
 RUBRIC_CANON: Dict[int, str] = {
@@ -103,11 +124,94 @@ SDG_MARKERS: Dict[int, int] = {
     17: 98,
 }
 SDG_TITLE_ROW = 1  # row with the title "SDG" in column B
+_SDG_STARTS: List[int] = [SDG_MARKERS[sdg] for sdg in range(1, 18)]  # sorted block start rows
+# Row ranges of SDG 1..16; only SDG 17's end depends on the sheet
+_FIXED_SDG_RANGES: Tuple[Tuple[int, int], ...] = tuple(
+    (SDG_MARKERS[sdg], SDG_MARKERS[sdg + 1] - 1) for sdg in range(1, 17)
+)
+
+# ============================== Patterns ==============================
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+_SECTOR_LABEL_RE = re.compile(r"\bsector\b\s*[:\-–|]?\s*", re.IGNORECASE)
+_SECTOR_WORD_RE = re.compile(r"\bsector\b", re.IGNORECASE)
+_TOKEN_SPLIT_RE = re.compile(r"[,/;|]+")
+_LEAD_SCORE_CLEAN_RE = re.compile(r"^\s*\(?\d+\)?\s*[:\-–\.]\s*")
+# Leading "3 -" / "(2):" score, else every rubric-like "N:" in the text; the prefix
+# alternative can only fire at position 0, so one finditer covers both
+_SCORE_NUM_RE = re.compile(
+    r"^\s*\(?(?P<prefix>[0-5])\)?(?:\s*[:\-\–\.\)]|\s)|(?<!\d)(?P<entry>[0-5])\s*[:\-\–\.\)]"
+)
+_NA_RE = re.compile(r"\b(n/?a|not applicable)\b")
+
+# Rubric phrase -> score numbers it supports ("operational" counts for both 4 and 5)
+_PHRASE_NUMS: Dict[str, List[int]] = {
+    ph: [num for num, phrases in RUBRIC_PHRASES.items() if ph in phrases]
+    for phrases in RUBRIC_PHRASES.values()
+    for ph in phrases
+}
+# One scan finds every phrase occurring anywhere in the text; the lookahead lets matches
+# overlap. No phrase is a prefix of another, so one alternative per position is enough.
+# The N/A phrases only count as whole words, like _NA_RE: otherwise the "na" inside
+# "operational" ties 0 with 4 and 5, and the tie-break would pick N/A.
+_PHRASE_RE = re.compile(
+    "(?=(%s))"
+    % "|".join(
+        r"\b%s\b" % re.escape(ph) if ph in RUBRIC_PHRASES[0] else re.escape(ph)
+        for ph in _PHRASE_NUMS
+    )
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_text(s: str) -> Optional[str]:
+    """Trim and collapse whitespace; None if nothing is left (memoized on the cell text)."""
+    s = _WS_RE.sub(" ", s.strip())
+    return s if s else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_key_text(s: str) -> Optional[str]:
+    s = _NON_ALNUM_RE.sub("_", s.strip().lower()).strip("_")
+    return s or None
+
+
+def _ratio_bound(a: str, b: str) -> float:
+    """Upper bound on SequenceMatcher(None, a, b).ratio() from the lengths alone."""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+def _closest(query: str, choices: List[str], cutoff: float = 0.0) -> Tuple[Optional[int], float]:
+    """
+    Index of the most similar choice and its 0–1 similarity ratio (rapidfuzz when installed).
+    Choices scoring below `cutoff` are skipped; returns (None, 0.0) when none reach it.
+    """
+    if process is not None:
+        match = process.extractOne(query, choices, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        if match is None:
+            return None, 0.0
+        return match[2], match[1] / 100.0
+
+    best_idx, best_ratio = None, 0.0
+    for idx, choice in enumerate(choices):
+        if choice == query:
+            return idx, 1.0
+        # Skip choices whose length alone keeps them below the cutoff or the current best
+        bound = _ratio_bound(query, choice)
+        if bound < cutoff or bound <= best_ratio:
+            continue
+        ratio = SequenceMatcher(None, query, choice).ratio()
+        if ratio >= cutoff and ratio > best_ratio:
+            best_idx, best_ratio = idx, ratio
+    return best_idx, best_ratio
 
 
 # ============================== Data Model ==============================
 @dataclass
 class QuestionnaireRow:
+    """Schema of the row dicts produced by QuestionnaireParser (same keys, same order)."""
+
     sdg_number: Optional[int] = None
     sdg_description: Optional[str] = None
     sector: Optional[str] = None
@@ -134,7 +238,9 @@ class QuestionnaireParser:
       • Extracts score from text or phrases
       • Works with 'Textile_revised', 'Fertilizer_revised', 'Packaging_revised'
       • Lets you pick a sheet by name, fuzzy name (e.g. "packaging"), or "3" (3rd sheet)
-      • Supports both file paths (str) and BytesIO objects for serverless deployment
+      • Supports file paths (str) and binary file objects (BytesIO, temp files) for serverless deployment
+      • Opens workbooks read-only and reads each sheet's values in one pass
+        (python-calamine when installed, openpyxl otherwise)
     """
 
     REQUIRED_HEADERS: Dict[str, List[str]] = {
@@ -148,13 +254,22 @@ class QuestionnaireParser:
         "status": ["status"],
         "comment": ["comment", "comments"],
     }
+    # Columns whose cells decide whether a row is kept ("scoring" yields score + description)
+    _DETAIL_KEYS: Tuple[str, ...] = (
+        "sustainability_dimension", "kpi", "question", "scoring", "source", "notes", "status", "comment",
+    )
+    # Lowercased header text -> canonical key (each variant belongs to exactly one key)
+    _HEADER_LOOKUP: Dict[str, str] = {
+        v.lower(): k for k, vals in REQUIRED_HEADERS.items() for v in vals
+    }
 
-    def __init__(self, file_source: Union[str, BytesIO], sheet_names: Optional[List[str]] = None):
+    def __init__(self, file_source: Union[str, BinaryIO], sheet_names: Optional[List[str]] = None):
         """
-        Initialize parser with either a file path or BytesIO object.
+        Initialize parser with either a file path or a binary file object.
         
         Args:
-            file_source: Either a file path (str) or BytesIO object containing Excel data
+            file_source: Either a file path (str) or a seekable binary file object
+                (BytesIO, SpooledTemporaryFile, ...) containing Excel data
             sheet_names: Optional list of sheet names to process
         """
         self.file_source = file_source
@@ -164,16 +279,31 @@ class QuestionnaireParser:
             "Packaging_revised",
         ]
 
+        # Streams keep an open workbook (calamine or read-only openpyxl) and only the sheets
+        # actually parsed are read from it; paths are read up front via the process-wide row
+        # cache and wb is None
+        self.wb = None
+        self._rows_by_sheet: Dict[str, List[Tuple[Any, ...]]] = {}
+
         try:
-            # Load workbook from either file path or BytesIO
-            if isinstance(file_source, BytesIO):
-                # Reset pointer to beginning for BytesIO
+            # Load workbook from either file path or file object
+            if hasattr(file_source, "read"):
+                # Reset pointer to beginning; the caller may already have read from it
                 file_source.seek(0)
-                self.wb = openpyxl.load_workbook(file_source, data_only=True)
-                logger.info(f"Loaded Excel from BytesIO | Sheets: {self.wb.sheetnames}")
+                if CalamineWorkbook is not None:
+                    self.wb = CalamineWorkbook.from_filelike(file_source)
+                    self.sheetnames: List[str] = list(self.wb.sheet_names)
+                else:
+                    self.wb = openpyxl.load_workbook(file_source, data_only=True, read_only=True, keep_links=False)
+                    self.sheetnames = self.wb.sheetnames
+                logger.info(f"Loaded Excel from {type(file_source).__name__} | Sheets: {self.sheetnames}")
             else:
-                self.wb = openpyxl.load_workbook(file_source, data_only=True)
-                logger.info(f"Loaded Excel: {file_source} | Sheets: {self.wb.sheetnames}")
+                st = os.stat(file_source)
+                self._rows_by_sheet = dict(
+                    _load_workbook_rows(os.path.abspath(file_source), st.st_mtime_ns, st.st_size)
+                )
+                self.sheetnames = list(self._rows_by_sheet)
+                logger.info(f"Loaded Excel: {file_source} | Sheets: {self.sheetnames}")
         except Exception as e:
             logger.exception(f"Failed to load workbook: {e}")
             raise
@@ -187,15 +317,54 @@ class QuestionnaireParser:
     def _norm(v: Any) -> Optional[str]:
         if v is None:
             return None
-        s = re.sub(r"\s+", " ", str(v).strip())
-        return s if s else None
+        return _norm_text(v if isinstance(v, str) else str(v))
+
+    @staticmethod
+    def _is_blank(v: Any) -> bool:
+        """True when _norm(v) would be None, checked without normalizing."""
+        return v is None or (isinstance(v, str) and not v.strip())
 
     @staticmethod
     def _norm_key(s: Optional[str]) -> Optional[str]:
         if s is None:
             return None
-        s = re.sub(r"[^a-z0-9]+", "_", str(s).strip().lower()).strip("_")
-        return s or None
+        return _norm_key_text(str(s))
+
+    # -------------------- helpers: cell access --------------------
+    @staticmethod
+    def _read_rows(ws) -> List[Tuple[Any, ...]]:
+        """Materialize a sheet's cell values in one streaming pass (read-only safe)."""
+        # Some writers store a wrong <dimension>; ignore it and read what's actually there.
+        # Rows then come back unpadded, which _cell tolerates.
+        ws.reset_dimensions()
+        return list(ws.iter_rows(values_only=True))
+
+    def _sheet_values(self, name: str) -> List[Tuple[Any, ...]]:
+        """Rows of sheet `name`, read from the workbook at most once per parser."""
+        rows = self._rows_by_sheet.get(name)
+        if rows is None:
+            if CalamineWorkbook is not None and isinstance(self.wb, CalamineWorkbook):
+                rows = _calamine_sheet_rows(self.wb, name)
+            else:
+                rows = self._read_rows(self.wb[name])
+            self._rows_by_sheet[name] = rows
+        return rows
+
+    @classmethod
+    def _row_str(cls, row_vals: Tuple[Any, ...], cidx: Optional[int]) -> Optional[str]:
+        """Normalized value at 0-based column `cidx` of a row tuple (None if unmapped or past the end)."""
+        if cidx is None or cidx >= len(row_vals):
+            return None
+        return cls._norm(row_vals[cidx])
+
+    @staticmethod
+    def _cell(rows: List[Tuple[Any, ...]], r: int, c: int) -> Any:
+        """Value at 1-based (row, column), or None outside the sheet."""
+        if 1 <= r <= len(rows):
+            row = rows[r - 1]
+            if 1 <= c <= len(row):
+                return row[c - 1]
+        return None
 
     # -------------------- helpers: sheet resolution --------------------
     def _resolve_sheet_name(self, desired: str) -> Optional[str]:
@@ -209,7 +378,7 @@ class QuestionnaireParser:
         except (AttributeError, TypeError):
             return None
     
-        avail = self.wb.sheetnames
+        avail = self.sheetnames
     
         # Exact match (case-insensitive)
         for a in avail:
@@ -217,16 +386,11 @@ class QuestionnaireParser:
                 return a
     
         # Fuzzy match
-        best_match, best_score = None, 0.0
-        for a in avail:
-            score = SequenceMatcher(None, low, a.lower()).ratio()
-            if score > best_score:
-                best_score = score
-                best_match = a
+        best_idx, best_score = _closest(low, [a.lower() for a in avail], cutoff=0.6)
     
         # Accept if score > 0.6
-        if best_score > 0.6:
-            return best_match
+        if best_idx is not None and best_score > 0.6:
+            return avail[best_idx]
     
         return None
 
@@ -239,37 +403,40 @@ class QuestionnaireParser:
             else:
                 logger.warning(f"Sheet '{s}' not found by name/index/fuzzy; skipping.")
         # If nothing resolved, fall back to all sheets
-        return out or self.wb.sheetnames
+        return out or self.sheetnames
 
     # -------------------- headers + ranges --------------------
-    def _detect_header_row_and_map(self, ws) -> Tuple[int, Dict[str, int]]:
-        max_scan_rows = min(30, ws.max_row)
+    def _detect_header_row_and_map(self, rows: List[Tuple[Any, ...]]) -> Tuple[int, Dict[str, int]]:
+        max_scan_rows = min(30, len(rows))
         best_row, best_hit, best_map = None, -1, {}
-        variants = {k: {v.lower() for v in vals} for k, vals in self.REQUIRED_HEADERS.items()}
 
-        for r in range(1, max_scan_rows + 1):
-            vals = [self._norm(c.value) for c in ws[r]]
-            if all(v is None for v in vals):
-                continue
+        # Blank rows simply score zero hits, so they need no separate check
+        for r, row_vals in enumerate(rows[:max_scan_rows], start=1):
             cand_map: Dict[str, int] = {}
-            for idx, val in enumerate(vals):
+            for idx, v in enumerate(row_vals):
+                if v is None:
+                    continue
+                val = self._norm(v)
                 if not val:
                     continue
-                low = val.lower()
-                for k, alts in variants.items():
-                    if low in alts and k not in cand_map:
-                        cand_map[k] = idx
+                k = self._HEADER_LOOKUP.get(val.lower())
+                if k and k not in cand_map:
+                    cand_map[k] = idx
             hits = len(cand_map)
             if hits > best_hit:
                 best_row, best_hit, best_map = r, hits, cand_map
+                # A complete match can't be beaten by a later row
+                if hits == len(self.REQUIRED_HEADERS):
+                    break
 
         if best_row is None or best_hit == 0:
             logger.error("Could not detect a header row with required columns. Check your sheet headers.")
             raise ValueError("Header row not found")
 
-        for k, col in best_map.items():
-            addr = f"{get_column_letter(col+1)}{best_row}"
-            logger.debug(f"Header map: {k} -> {addr} ('{ws.cell(best_row, col+1).value}')")
+        if logger.isEnabledFor(logging.DEBUG):
+            for k, col in best_map.items():
+                addr = f"{get_column_letter(col+1)}{best_row}"
+                logger.debug(f"Header map: {k} -> {addr} ('{self._cell(rows, best_row, col + 1)}')")
 
         missing = [k for k in self.REQUIRED_HEADERS if k not in best_map]
         if missing:
@@ -279,35 +446,39 @@ class QuestionnaireParser:
 
         return best_row, best_map
 
-    def _build_sdg_ranges(self, ws) -> Dict[int, Tuple[int, int]]:
-        total_rows = ws.max_row
-        ranges: Dict[int, Tuple[int, int]] = {}
-        for sdg in range(1, 18):
-            start = SDG_MARKERS[sdg]
-            end = (SDG_MARKERS[sdg + 1] - 1) if sdg < 17 else total_rows
-            ranges[sdg] = (start, end)
+    def _build_sdg_ranges(self, title: str, rows: List[Tuple[Any, ...]]) -> Dict[int, Tuple[int, int]]:
+        ranges: Dict[int, Tuple[int, int]] = dict(enumerate(_FIXED_SDG_RANGES, start=1))
+        ranges[17] = (SDG_MARKERS[17], len(rows))
 
         # Sanity logs
-        b1 = self._norm(ws.cell(row=SDG_TITLE_ROW, column=2).value)
+        b1 = self._norm(self._cell(rows, SDG_TITLE_ROW, 2))
         if not b1 or "sdg" not in (b1.lower() if b1 else ""):
             logger.warning(f"B1 expected to contain 'SDG', found: {b1!r}")
-        for sdg, (r1, r2) in ranges.items():
-            header_label = self._norm(ws.cell(row=r1, column=2).value)
-            logger.debug(f"{ws.title}: SDG {sdg} block B{r1}='{header_label}' rows={r1}-{r2}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for sdg, (r1, r2) in ranges.items():
+                header_label = self._norm(self._cell(rows, r1, 2))
+                logger.debug(f"{title}: SDG {sdg} block B{r1}='{header_label}' rows={r1}-{r2}")
         return ranges
 
     # -------------------- sector helpers --------------------
-    def _canonicalize_sector(self, raw: Optional[str]) -> Optional[str]:
-        """Return 'Textiles'/'Fertilizers'/'Packaging' or None."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _canonicalize_sector(raw: Optional[str]) -> Optional[str]:
+        """Return 'Textiles'/'Fertilizers'/'Packaging' or None (memoized; the same labels repeat)."""
         if not raw:
             return None
+        # Fast path: the whole label is a known synonym ("Textiles", "packaging", ...)
+        whole = str(raw).strip().lower()
+        if whole in SECTOR_SYNONYMS:
+            return SECTOR_SYNONYMS[whole]
+
         # remove the label "Sector:"
-        s = re.sub(r"\bsector\b\s*[:\-–|]?\s*", "", str(raw), flags=re.IGNORECASE)
-        tokens = re.split(r"[,/;|]+", s)
+        s = _SECTOR_LABEL_RE.sub("", str(raw))
+        tokens = _TOKEN_SPLIT_RE.split(s)
         candidates: List[str] = []
 
         for t in tokens if tokens else [s]:
-            tt = re.sub(r"\bsector\b", "", t, flags=re.IGNORECASE).strip()
+            tt = _SECTOR_WORD_RE.sub("", t).strip()
             if not tt:
                 continue
             low = tt.lower()
@@ -318,13 +489,9 @@ class QuestionnaireParser:
                 continue
 
             # fuzzy near-miss
-            best_match, best_ratio = None, 0.0
-            for key, canon in SECTOR_SYNONYMS.items():
-                ratio = SequenceMatcher(None, low, key).ratio()
-                if ratio > best_ratio:
-                    best_match, best_ratio = canon, ratio
-            if best_match and best_ratio >= 0.80:
-                candidates.append(best_match)
+            best_idx, _ = _closest(low, _SECTOR_KEYS, cutoff=0.80)
+            if best_idx is not None:
+                candidates.append(SECTOR_SYNONYMS[_SECTOR_KEYS[best_idx]])
 
         uniq: List[str] = []
         for c in candidates:
@@ -337,84 +504,73 @@ class QuestionnaireParser:
             logger.warning(f"Multiple sector candidates {uniq}; selecting '{uniq[0]}'")
         return uniq[0]
 
-    def _extract_sector_default(self, ws, sheet_name: Optional[str]) -> Optional[str]:
+    def _extract_sector_default(self, rows: List[Tuple[Any, ...]], sheet_name: Optional[str]) -> Optional[str]:
         """C3 first; then guess from sheet name."""
-        try:
-            raw = self._norm(ws["C3"].value)
-        except Exception:
-            raw = None
+        raw = self._norm(self._cell(rows, 3, 3))
         canon = self._canonicalize_sector(raw)
 
         if not canon and sheet_name:
             name = sheet_name.lower()
-            if "textile" in name:
-                canon = "Textiles"
-            elif "fertilizer" in name or "fertilis" in name:
-                canon = "Fertilizers"
-            elif "packag" in name:  # covers packaging/package/packed
-                canon = "Packaging"
+            canon = next((sector for kw, sector in SHEET_NAME_SECTORS if kw in name), None)
 
         logger.info(f"Default sector resolved: {canon!r} (C3 raw={raw!r}, sheet_name={sheet_name!r})")
         return canon
 
     def _extract_sector_by_sdg(
-        self, ws, sdg_ranges: Dict[int, Tuple[int, int]], sheet_name: Optional[str]
+        self, rows: List[Tuple[Any, ...]], sdg_ranges: Dict[int, Tuple[int, int]], sheet_name: str
     ) -> Dict[int, Optional[str]]:
-        default_sector = self._extract_sector_default(ws, sheet_name)
+        default_sector = self._extract_sector_default(rows, sheet_name)
+        debug = logger.isEnabledFor(logging.DEBUG)
         by_sdg: Dict[int, Optional[str]] = {}
         for sdg, (start_row, _) in sdg_ranges.items():
-            raw = self._norm(ws.cell(row=start_row, column=3).value)  # Column C on SDG header row
+            raw = self._norm(self._cell(rows, start_row, 3))  # Column C on SDG header row
             canon = self._canonicalize_sector(raw) or default_sector
             by_sdg[sdg] = canon
-            logger.debug(f"[{ws.title}] SDG {sdg}: C{start_row} raw={raw!r} -> sector={canon!r} (fallback={default_sector!r})")
+            if debug:
+                logger.debug(f"[{sheet_name}] SDG {sdg}: C{start_row} raw={raw!r} -> sector={canon!r} (fallback={default_sector!r})")
         return by_sdg
 
     # -------------------- scoring helpers --------------------
     @staticmethod
     def _clean_scoring_text(txt: str) -> str:
         # Remove leading number/colon/dash like "3 -", "(2) :", "4:"
-        return re.sub(r"^\s*\(?\d+\)?\s*[:\-–\.]\s*", "", txt).strip()
+        return _LEAD_SCORE_CLEAN_RE.sub("", txt).strip()
 
-    def _extract_score_number(self, scoring_val: Optional[str]) -> Optional[int]:
-        """Try to get 0–5 from the scoring cell."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_score_number(scoring_val: Optional[str]) -> Optional[int]:
+        """Try to get 0–5 from the scoring cell (memoized; rubric text repeats across rows)."""
         if not scoring_val:
             return None
         txt = str(scoring_val).strip()
 
-        # Leading number
-        m = re.match(r"^\s*\(?([0-5])\)?(?:\s*[:\-\–\.\)]|\s)", txt)
-        if m:
-            return int(m.group(1))
-
-        # If exactly one rubric-like "N:" appears
-        nums = re.findall(r"(?<!\d)([0-5])\s*[:\-\–\.\)]", txt)
-        uniq = sorted({int(n) for n in nums})
-        if len(uniq) == 1:
-            return uniq[0]
-        if len(uniq) > 1:
-            return None  # too many numbers; don't guess
+        # Leading number (only ever the first match), else exactly one rubric-like "N:"
+        entry = None
+        for m in _SCORE_NUM_RE.finditer(txt):
+            prefix = m.group("prefix")
+            if prefix is not None:
+                return int(prefix)
+            num = m.group("entry")
+            if entry is None:
+                entry = num
+            elif num != entry:
+                return None  # too many numbers; don't guess
+        if entry is not None:
+            return int(entry)
 
         # Phrase mapping
-        low = re.sub(r"\s+", " ", txt).lower()
-        if re.search(r"\b(n/?a|not applicable)\b", low):
+        low = _WS_RE.sub(" ", txt).lower()
+        if _NA_RE.search(low):
             return 0
 
-        def phrase_score(targets: List[str]) -> int:
-            s = 0
-            for ph in targets:
-                if ph in low:
-                    s += 2
-                else:
-                    r = SequenceMatcher(None, ph, low).ratio()
-                    if r > 0.6:
-                        s += 1
-            return s
-
-        best_num, best_s = None, -1
-        for num, phrases in RUBRIC_PHRASES.items():
-            ps = phrase_score(phrases)
-            if ps > best_s:
-                best_num, best_s = num, ps
+        scores: Dict[int, int] = {}
+        for ph in {m.group(1) for m in _PHRASE_RE.finditer(low)}:
+            for num in _PHRASE_NUMS[ph]:
+                scores[num] = scores.get(num, 0) + 2
+
+        # First rubric number with the highest score wins ties
+        best_num = max(RUBRIC_PHRASES, key=lambda num: scores.get(num, 0))
+        best_s = scores.get(best_num, 0)
         return best_num if best_s >= 2 else None
 
     def _derive_score_description(self, scoring_cell: Optional[str], score: Optional[int]) -> Optional[str]:
@@ -427,90 +583,170 @@ class QuestionnaireParser:
     # -------------------- row extraction --------------------
     def _sheet_rows(
         self,
-        ws,
+        title: str,
+        rows: List[Tuple[Any, ...]],
         header_row: int,
         col_map: Dict[str, int],
         sdg_ranges: Dict[int, Tuple[int, int]],
         sector_by_sdg: Dict[int, Optional[str]],
-    ) -> List[Dict]:
-        records: List[Dict] = []
+    ) -> Iterator[Dict]:
+        """Yield the sheet's questionnaire rows one at a time."""
+        collected = 0
+        sdg_counts: Dict[int, int] = {}  # rows kept per SDG, for the trace logs
+        debug = logger.isEnabledFor(logging.DEBUG)
         data_start = header_row + 1
-        data_end = ws.max_row
-
-        # row -> sdg_number
-        row_to_sdg: Dict[int, int] = {}
-        for sdg, (r1, r2) in sdg_ranges.items():
-            for r in range(r1, r2 + 1):
-                row_to_sdg[r] = sdg
-
-        def get_cell_str(r: int, key: str) -> Optional[str]:
-            if key not in col_map:
-                return None
-            cidx = col_map[key] + 1
-            return self._norm(ws.cell(row=r, column=cidx).value)
-
-        for r in range(data_start, data_end + 1):
-            row_vals = [c.value for c in ws[r]]
-            if all(v is None for v in row_vals):
+        data_end = len(rows)
+        detail_cols = [col_map[k] for k in self._DETAIL_KEYS if k in col_map]
+
+        cur_sdg = None  # SDG of the previous row; description and sector only change with it
+        sdg_desc = sector = None
+
+        for r, row_vals in enumerate(rows[data_start - 1:data_end], start=data_start):
+            # Blocks are contiguous from B2 to the last row, so the block is the last start <= r
+            sdg_number = bisect.bisect_right(_SDG_STARTS, r)
+            if not sdg_number:
                 continue
 
-            sdg_number = row_to_sdg.get(r)
-            if sdg_number is None:
+            # Blank detail cells normalize to None, so such rows would be dropped below anyway
+            # (this also covers fully empty rows)
+            width = len(row_vals)
+            if all(self._is_blank(row_vals[c]) for c in detail_cols if c < width):
                 continue
 
-            sector = sector_by_sdg.get(sdg_number)
+            # Mapped columns of this row, normalized once (short rows read as empty)
+            cells = {key: self._norm(row_vals[cidx]) if cidx < width else None for key, cidx in col_map.items()}
+
+            if sdg_number != cur_sdg:
+                cur_sdg = sdg_number
+                sdg_desc = SDG_DESCRIPTIONS.get(sdg_number)
+                sector = sector_by_sdg.get(sdg_number)
             if sector is None:
                 logger.warning(
-                    f"[{ws.title}] R{r} SDG{sdg_number}: sector is None — check C{sdg_ranges[sdg_number][0]} and C3 / sheet name."
+                    f"[{title}] R{r} SDG{sdg_number}: sector is None — check C{sdg_ranges[sdg_number][0]} and C3 / sheet name."
                 )
 
-            scoring_cell = get_cell_str(r, "scoring")
+            scoring_cell = cells.get("scoring")
             score = self._extract_score_number(scoring_cell)
             score_desc = self._derive_score_description(scoring_cell, score)
 
-            row = QuestionnaireRow(
-                sdg_number=sdg_number,
-                sdg_description=SDG_DESCRIPTIONS.get(sdg_number),
-                sector=sector,
-                sdg_target=get_cell_str(r, "sdg_target"),
-                sustainability_dimension=get_cell_str(r, "sustainability_dimension"),
-                kpi=get_cell_str(r, "kpi"),
-                question=get_cell_str(r, "question"),
-                score=score,
-                score_description=score_desc,
-                source=get_cell_str(r, "source"),
-                notes=get_cell_str(r, "notes"),
-                status=get_cell_str(r, "status"),
-                comment=get_cell_str(r, "comment"),
-            )
+            # Plain dict in QuestionnaireRow field order (asdict() deep-copies every field)
+            row = {
+                "sdg_number": sdg_number,
+                "sdg_description": sdg_desc,
+                "sector": sector,
+                "sdg_target": cells.get("sdg_target"),
+                "sustainability_dimension": cells.get("sustainability_dimension"),
+                "kpi": cells.get("kpi"),
+                "question": cells.get("question"),
+                "score": score,
+                "score_description": score_desc,
+                "source": cells.get("source"),
+                "notes": cells.get("notes"),
+                "status": cells.get("status"),
+                "comment": cells.get("comment"),
+            }
 
             # Strict skip: if all "detail" fields are empty, drop it
             empties = [
-                row.sustainability_dimension,
-                row.kpi,
-                row.question,
-                row.score,
-                row.score_description,
-                row.source,
-                row.notes,
-                row.status,
-                row.comment,
+                row["sustainability_dimension"],
+                row["kpi"],
+                row["question"],
+                row["score"],
+                row["score_description"],
+                row["source"],
+                row["notes"],
+                row["status"],
+                row["comment"],
             ]
             if all(v in (None, "", []) for v in empties):
                 continue
 
             # Some trace logs per SDG (first few only)
-            if len([x for x in records if x.get("sdg_number") == sdg_number]) < 3:
+            kept = sdg_counts.get(sdg_number, 0)
+            if debug and kept < 3:
                 logger.debug(
-                    f"{ws.title}: R{r} SDG{sdg_number} '{row.sdg_description}' "
-                    f"sector='{sector}' score={row.score} KPI='{row.kpi}' "
-                    f"Q='{(row.question or '')[:60]}'"
+                    f"{title}: R{r} SDG{sdg_number} '{row['sdg_description']}' "
+                    f"sector='{sector}' score={row['score']} KPI='{row['kpi']}' "
+                    f"Q='{(row['question'] or '')[:60]}'"
                 )
 
-            records.append(asdict(row))
+            sdg_counts[sdg_number] = kept + 1
+            collected += 1
+            yield row
 
-        logger.info(f"{ws.title}: collected {len(records)} questionnaire rows")
-        return records
+        logger.info(f"{title}: collected {collected} questionnaire rows")
+
+    def _sheet_questions(
+        self,
+        title: str,
+        rows: List[Tuple[Any, ...]],
+        header_row: int,
+        col_map: Dict[str, int],
+        sdg_ranges: Dict[int, Tuple[int, int]],
+        sector_by_sdg: Dict[int, Optional[str]],
+    ) -> Iterator[Dict]:
+        """
+        Yield only the rows that have a question, with only the fields the interactive UI uses.
+        Same values as _sheet_rows for those rows, minus the scoring and free-text columns.
+        """
+        q_col = col_map.get("question")
+        if q_col is None:
+            logger.info(f"{title}: no question column; collected 0 questions")
+            return
+
+        target_col = col_map.get("sdg_target")
+        dimension_col = col_map.get("sustainability_dimension")
+        kpi_col = col_map.get("kpi")
+
+        collected = 0
+        cur_sdg = None  # SDG of the previous row; description and sector only change with it
+        sdg_desc = sector = None
+        for r, row_vals in enumerate(rows[header_row:], start=header_row + 1):
+            sdg_number = bisect.bisect_right(_SDG_STARTS, r)
+            if not sdg_number:
+                continue
+
+            question = self._row_str(row_vals, q_col)
+            if not question:
+                continue
+
+            if sdg_number != cur_sdg:
+                cur_sdg = sdg_number
+                sdg_desc = SDG_DESCRIPTIONS.get(sdg_number)
+                sector = sector_by_sdg.get(sdg_number)
+            if sector is None:
+                logger.warning(
+                    f"[{title}] R{r} SDG{sdg_number}: sector is None — check C{sdg_ranges[sdg_number][0]} and C3 / sheet name."
+                )
+
+            collected += 1
+            yield {
+                "sdg_number": sdg_number,
+                "sdg_description": sdg_desc,
+                "sector": sector,
+                "sdg_target": self._row_str(row_vals, target_col),
+                "sustainability_dimension": self._row_str(row_vals, dimension_col),
+                "kpi": self._row_str(row_vals, kpi_col),
+                "question": question,
+            }
+
+        logger.info(f"{title}: collected {collected} questions")
+
+    def _iter_sheet(
+        self, resolved: str, questions_only: bool = False
+    ) -> Tuple[Iterator[Dict], Dict[int, Optional[str]]]:
+        """Resolve layout and sectors up front (header errors raise here); rows are produced lazily."""
+        sheet = self._sheet_values(resolved)
+        sdg_ranges = self._build_sdg_ranges(resolved, sheet)
+        sector_by_sdg = self._extract_sector_by_sdg(sheet, sdg_ranges, resolved)
+        header_row, col_map = self._detect_header_row_and_map(sheet)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{resolved}: header at R{header_row}, map={col_map}")
+            logger.debug(f"{resolved}: sector_by_sdg = {sector_by_sdg}")
+
+        produce = self._sheet_questions if questions_only else self._sheet_rows
+        rows = produce(resolved, sheet, header_row, col_map, sdg_ranges, sector_by_sdg)
+        return rows, sector_by_sdg
 
     # -------------------- public API --------------------
     def extract_questionnaire_data(self, sheet_name: str) -> Dict[str, Any]:
@@ -519,15 +755,22 @@ class QuestionnaireParser:
             logger.warning(f"Sheet '{sheet_name}' not found; skipping.")
             return {"rows": [], "sector_by_sdg": {}}
 
-        ws = self.wb[resolved]
-        sdg_ranges = self._build_sdg_ranges(ws)
-        sector_by_sdg = self._extract_sector_by_sdg(ws, sdg_ranges, resolved)
-        header_row, col_map = self._detect_header_row_and_map(ws)
-        logger.debug(f"{resolved}: header at R{header_row}, map={col_map}")
+        rows, sector_by_sdg = self._iter_sheet(resolved)
+        return {"rows": list(rows), "sector_by_sdg": sector_by_sdg}
 
-        rows = self._sheet_rows(ws, header_row, col_map, sdg_ranges, sector_by_sdg)
-        logger.debug(f"{resolved}: sector_by_sdg = {sector_by_sdg}")
-        return {"rows": rows, "sector_by_sdg": sector_by_sdg}
+    def iter_questions(self, sheet_name: str) -> Iterator[Dict]:
+        """
+        Rows of `sheet_name` that have a question, yielded one at a time with only
+        sdg_number, sdg_description, sector, sdg_target, sustainability_dimension, kpi
+        and question. Skips score extraction entirely.
+        """
+        resolved = self._resolve_sheet_name(sheet_name)
+        if not resolved:
+            logger.warning(f"Sheet '{sheet_name}' not found; skipping.")
+            return iter(())
+
+        rows, _ = self._iter_sheet(resolved, questions_only=True)
+        return rows
 
     def parse_all_data(self) -> Dict[str, Dict[str, Any]]:
         out: Dict[str, Dict[str, Any]] = {}
@@ -539,17 +782,58 @@ class QuestionnaireParser:
     
     def close(self):
         """Close the workbook to free resources."""
-        if hasattr(self, 'wb'):
+        if getattr(self, 'wb', None) is not None:
             self.wb.close()
 
 
+# ============================== Workbook Loading ==============================
+def _calamine_value(v: Any) -> Any:
+    """Map a calamine cell value onto what openpyxl would return for the same cell."""
+    if v == "":
+        return None  # empty cell
+    if type(v) is float and v.is_integer():
+        return int(v)  # openpyxl keeps whole numbers as int
+    if type(v) is datetime.date:
+        return datetime.datetime(v.year, v.month, v.day)
+    return v
+
+
+def _calamine_sheet_rows(wb, name: str) -> List[Tuple[Any, ...]]:
+    """One sheet's values via calamine (Rust), anchored at A1 like openpyxl's rows."""
+    return [
+        tuple(_calamine_value(v) for v in row)
+        for row in wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_workbook_rows(path: str, mtime_ns: int, size: int) -> Dict[str, List[Tuple[Any, ...]]]:
+    """
+    Values of every sheet in the workbook at `path`, keyed by sheet name in workbook order.
+    mtime_ns and size are only part of the cache key, so a file changed on disk is re-read.
+    The cached rows are shared between parsers and must not be mutated.
+    """
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        try:
+            return {name: _calamine_sheet_rows(wb, name) for name in wb.sheet_names}
+        finally:
+            wb.close()
+
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True, keep_links=False)
+    try:
+        return {name: QuestionnaireParser._read_rows(wb[name]) for name in wb.sheetnames}
+    finally:
+        wb.close()
+
+
 # ============================== Convenience Wrappers ==============================
-def parse_excel_questionnaire(file_source: Union[str, BytesIO], sheet_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+def parse_excel_questionnaire(file_source: Union[str, BinaryIO], sheet_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
     """
-    Parse Excel questionnaire from file path or BytesIO.
+    Parse Excel questionnaire from file path or binary file object.
     
     Args:
-        file_source: Either a file path (str) or BytesIO object
+        file_source: Either a file path (str) or binary file object (e.g. BytesIO)
         sheet_names: Optional list of sheet names to process
     
     Returns:
@@ -562,13 +846,13 @@ def parse_excel_questionnaire(file_source: Union[str, BytesIO], sheet_names: Opt
         parser.close()
 
 
-def extract_questions_for_interactive(file_source: Union[str, BytesIO], sheet_name: Optional[str] = None) -> Dict[str, Any]:
+def extract_questions_for_interactive(file_source: Union[str, BinaryIO], sheet_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Extract ONLY questions (no scores) for interactive UI.
-    Works with both file paths and BytesIO objects (for Vercel serverless).
+    Works with both file paths and binary file objects (for Vercel serverless).
 
     Args:
-        file_source: Either a file path (str) or BytesIO object
+        file_source: Either a file path (str) or binary file object (e.g. BytesIO)
         sheet_name: Name of sheet to extract, or None to extract all default sheets
     
     Returns:
@@ -590,28 +874,37 @@ def extract_questions_for_interactive(file_source: Union[str, BytesIO], sheet_na
     all_questions = []
     last_sector = "General"
     
-    for sheet in parser.sheet_names:
-        try:
-            # Use extract_questionnaire_data for each sheet
-            data = parser.extract_questionnaire_data(sheet)
+    try:
+        for sheet in parser.sheet_names:
+            try:
+                # Stream the sheet's rows; keep only what the UI needs from each
+                sheet_questions = []
+                sheet_sector = last_sector
+                
+                for row in parser.iter_questions(sheet):
+                    if row.get("question"):
+                        sheet_questions.append({
+                            "id": row.get("id") or f"q_{len(all_questions) + len(sheet_questions) + 1}",
+                            "sdg_number": row.get("sdg_number"),
+                            "sdg_description": row.get("sdg_description"),
+                            "sdg_target": row.get("sdg_target"),
+                            "sustainability_dimension": row.get("sustainability_dimension"),
+                            "kpi": row.get("kpi"),
+                            "question": row.get("question"),
+                            "sector": row.get("sector", "Unknown")
+                        })
+                        sheet_sector = row.get("sector", sheet_sector)
+                
+                # A sheet that fails midway contributes nothing
+                all_questions.extend(sheet_questions)
+                last_sector = sheet_sector
             
-            for idx, row in enumerate(data.get("rows", [])):
-                if row.get("question"):
-                    all_questions.append({
-                        "id": row.get("id") or f"q_{len(all_questions) + 1}",
-                        "sdg_number": row.get("sdg_number"),
-                        "sdg_description": row.get("sdg_description"),
-                        "sdg_target": row.get("sdg_target"),
-                        "sustainability_dimension": row.get("sustainability_dimension"),
-                        "kpi": row.get("kpi"),
-                        "question": row.get("question"),
-                        "sector": row.get("sector", "Unknown")
-                    })
-                    last_sector = row.get("sector", last_sector)
-        
-        except Exception as e:
-            logger.warning(f"Failed to extract from sheet '{sheet}': {e}")
-            continue
+            except Exception as e:
+                logger.warning(f"Failed to extract from sheet '{sheet}': {e}")
+                continue
+    finally:
+        # Read-only workbooks hold the archive open until closed
+        parser.close()
     
     return {
         "questions": all_questions,
@@ -621,6 +914,11 @@ def extract_questions_for_interactive(file_source: Union[str, BytesIO], sheet_na
 
 # ============================== CLI ==============================
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    )
+    logger.setLevel(logging.DEBUG)
     xlsx = "backend/data/final.xlsx"  # change if needed
     try:
         parsed = parse_excel_questionnaire(xlsx)
@@ -1,12 +1,36 @@
 # backend/routers/questionnaire.py
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict
+from collections import defaultdict
+
+from fastapi import APIRouter, HTTPException, Response
+from typing import Callable, List, Dict, Tuple
 from pydantic import BaseModel
-import os
+
+from utils.responses import json_response
+from utils.serialization import dumps
 
 router = APIRouter(prefix="/api", tags=["questionnaire"])
 
+_SCORE_DESCRIPTIONS = {
+    0: "N/A",
+    1: "Issue identified, but no plans for further actions",
+    2: "Issue identified, starts planning further actions",
+    3: "Action plan with clear targets and deadlines in place",
+    4: "Action plan operational - some progress in established targets",
+    5: "Action plan operational - achieving the target set"
+}
+
+# Serialized /questionnaire/template body per source, reused until the upload cache
+# or the default template hands back a different object
+_template_bodies: Dict[str, Tuple[Dict, bytes]] = {}
+
+
+def _template_response(source: str, data: Dict, build: Callable[[Dict], Dict]) -> Response:
+    hit = _template_bodies.get(source)
+    if hit is None or hit[0] is not data:
+        hit = _template_bodies[source] = (data, dumps(build(data)))
+    return json_response(hit[1])
+
 class UserResponse(BaseModel):
     question_id: str
     score: int  # 0-5
@@ -26,32 +50,25 @@ async def calculate_scorecard(data: CalculateRequest):
         # Map responses by question_id
         response_map = {r.question_id: r.score for r in data.responses}
         
-        # Build rows with scores
-        rows = []
+        # Build rows with scores, grouped by sector in the same pass
+        sector_groups = defaultdict(list)
         for q in data.questions:
             q_id = q.get("id")
             score = response_map.get(q_id, 0)
+            sector = q.get("sector")
             
-            rows.append({
+            sector_groups[sector].append({
                 "sdg_number": q.get("sdg_number"),
                 "sdg_description": q.get("sdg_description"),
                 "sdg_target": q.get("sdg_target"),
                 "sustainability_dimension": q.get("sustainability_dimension"),
                 "kpi": q.get("kpi"),
                 "question": q.get("question"),
-                "sector": q.get("sector"),
+                "sector": sector,
                 "score": score,
                 "score_description": get_score_description(score)
             })
         
-        # Group by sector
-        sector_groups = {}
-        for row in rows:
-            sector = row.get("sector", "Unknown")
-            if sector not in sector_groups:
-                sector_groups[sector] = []
-            sector_groups[sector].append(row)
-        
         return {
             "success": True,
             "data": {
@@ -64,15 +81,7 @@ async def calculate_scorecard(data: CalculateRequest):
 
 def get_score_description(score: int) -> str:
     """Map score to description."""
-    descriptions = {
-        0: "N/A",
-        1: "Issue identified, but no plans for further actions",
-        2: "Issue identified, starts planning further actions",
-        3: "Action plan with clear targets and deadlines in place",
-        4: "Action plan operational - some progress in established targets",
-        5: "Action plan operational - achieving the target set"
-    }
-    return descriptions.get(score, "Unknown")
+    return _SCORE_DESCRIPTIONS.get(score, "Unknown")
 
 @router.get("/questionnaire/template")
 async def get_template():
@@ -97,54 +106,34 @@ async def get_template():
         
         if cached_data:
             # Return uploaded data
-            return {
-                **cached_data,
-                "source": "uploaded"
-            }
-        
-        # No uploaded file yet - load from default file
-        from parsers.excel_parser import extract_questions_for_interactive
-        
-        default_file = os.path.join("backend", "data", "final.xlsx")
+            return _template_response(
+                "uploaded", cached_data, lambda data: {**data, "source": "uploaded"}
+            )
         
-        if not os.path.exists(default_file):
-            default_file = os.path.join("data", "final.xlsx")
-            if not os.path.exists(default_file):
-                raise HTTPException(
-                    404,
-                    "No questionnaire available. Please upload an Excel file first."
-                )
+        # No uploaded file yet - load the bundled default questionnaire
+        from utils.default_template import load_default_template
         
-        all_questions = []
-        last_sector = "General"
+        template = load_default_template()
         
-        # Load from default file
-        for sheet_name in ["Textile_revised", "Fertilizer_revised", "Packaging_revised"]:
-            try:
-                result = extract_questions_for_interactive(default_file, sheet_name)
-                if result["questions"]:
-                    all_questions.extend(result["questions"])
-                    last_sector = result.get("sector", last_sector)
-            except Exception as e:
-                print(f"Warning: Could not load sheet '{sheet_name}': {str(e)}")
-                continue
+        if template is None:
+            raise HTTPException(
+                404,
+                "No questionnaire available. Please upload an Excel file first."
+            )
         
-        if not all_questions:
+        if not template["questions"]:
             raise HTTPException(
                 500,
                 "No questions available. Please upload an Excel file."
             )
         
-        # Cache the default data too
-        questionnaire_cache.set_data(all_questions, last_sector)
-        
-        return {
+        return _template_response("default", template, lambda data: {
             "success": True,
-            "questions": all_questions,
-            "sector": last_sector,
-            "total_questions": len(all_questions),
+            "questions": data["questions"],
+            "sector": data["sector"],
+            "total_questions": len(data["questions"]),
             "source": "default"
-        }
+        })
         
     except HTTPException:
         raise
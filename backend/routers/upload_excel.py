@@ -1,12 +1,31 @@
 # backend/routers/upload_excel.py
 
 from fastapi import APIRouter, File, UploadFile, HTTPException, Form
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
-from io import BytesIO
 import traceback
+import zipfile
+
+from utils.responses import json_response
+from utils.serialization import dumps
 
 router = APIRouter(prefix="/api", tags=["upload"])
 
+
+def _is_xlsx_container(fileobj) -> bool:
+    """True if the stream is a ZIP archive with a workbook part; the stream is left rewound"""
+    try:
+        if not zipfile.is_zipfile(fileobj):
+            return False
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as archive:
+            return "xl/workbook.xml" in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+    finally:
+        fileobj.seek(0)
+
+
 @router.post("/upload-excel")
 async def upload_excel_endpoint(
     file: UploadFile = File(...),
@@ -24,22 +43,25 @@ async def upload_excel_endpoint(
         if not file.filename.lower().endswith(('.xlsx', '.xls')):
             raise HTTPException(400, "File must be an Excel file (.xlsx or .xls)")
         
-        # Read file into memory
-        content = await file.read()
-        excel_file = BytesIO(content)
-        excel_file.seek(0)
+        # Parse straight from the spooled upload (the parser rewinds it) instead of
+        # copying the whole body into a bytes object first
+        excel_file = file.file
+        
+        # An .xlsx is a ZIP container holding xl/workbook.xml; reject anything else
+        # (e.g. a renamed .docx) before loading it. .xls is an OLE file and is left
+        # to the parser
+        if file.filename.lower().endswith('.xlsx') and not _is_xlsx_container(excel_file):
+            raise HTTPException(400, "File is not a valid .xlsx workbook")
         
         # Import here to avoid circular dependency
-        from parsers.excel_parser import extract_questions_for_interactive
         from utils.cache import questionnaire_cache
         
         print(f"📤 Processing file: {file.filename}, sheet: {sheet_name}")
         
-        # Extract questions
-        if sheet_name:
-            result = extract_questions_for_interactive(excel_file, sheet_name)
-        else:
-            result = extract_questions_for_interactive(excel_file)
+        # Extract questions in the threadpool; parsing is blocking CPU work that would
+        # otherwise stall every other request on the event loop. Re-uploads of an
+        # identical workbook reuse the earlier parse.
+        result = await run_in_threadpool(questionnaire_cache.parse_upload, excel_file, sheet_name)
         
         if not result.get("questions"):
             raise HTTPException(
@@ -56,13 +78,13 @@ async def upload_excel_endpoint(
         
         print(f"✅ Successfully processed {len(result['questions'])} questions")
         
-        # Return the same response format
-        return {
+        # Return the same response format, encoded with orjson rather than jsonable_encoder
+        return json_response(dumps({
             "success": True,
             "questions": result["questions"],
             "sector": result.get("sector", "General"),
             "total_questions": len(result["questions"])
-        }
+        }))
         
     except HTTPException:
         raise
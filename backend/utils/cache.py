@@ -1,16 +1,29 @@
 # backend/utils/cache.py
-from typing import Optional, Dict, List
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Dict, List, Tuple
+
+# Parse results kept for re-uploads of an identical workbook
+PARSED_CACHE_SIZE = 16
+
+
+def content_digest(fileobj: BinaryIO) -> str:
+    """blake2b of a binary stream's full contents; the stream is left rewound"""
+    fileobj.seek(0)
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: fileobj.read(1 << 16), b""):
+        h.update(chunk)
+    fileobj.seek(0)
+    return h.hexdigest()
+
 
 class QuestionnaireCache:
     
-    _instance = None
-    _data: Optional[Dict] = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._data = None
-        return cls._instance
+    def __init__(self) -> None:
+        self._data: Optional[Dict] = None
+        self._parsed: "OrderedDict[Tuple[str, Optional[str]], Dict]" = OrderedDict()
+        self._lock = threading.Lock()  # guards _parsed; uploads are parsed on threadpool workers
     
     def set_data(self, questions: List[Dict], sector: str) -> None:
         """Store uploaded questionnaire data"""
@@ -30,10 +43,44 @@ class QuestionnaireCache:
         """Check if cache has data"""
         return self._data is not None
     
+    def get_parsed(self, digest: str, sheet_name: Optional[str]) -> Optional[Dict]:
+        """Parse result for a workbook with this content digest, if seen recently"""
+        key = (digest, sheet_name)
+        with self._lock:
+            result = self._parsed.get(key)
+            if result is not None:
+                self._parsed.move_to_end(key)
+        return result
+    
+    def set_parsed(self, digest: str, sheet_name: Optional[str], result: Dict) -> None:
+        """Remember a parse result, evicting the least recently used beyond PARSED_CACHE_SIZE"""
+        with self._lock:
+            self._parsed[(digest, sheet_name)] = result
+            self._parsed.move_to_end((digest, sheet_name))
+            while len(self._parsed) > PARSED_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+    
+    def parse_upload(self, fileobj: BinaryIO, sheet_name: Optional[str] = None) -> Dict:
+        """
+        extract_questions_for_interactive for an uploaded workbook, reusing the earlier
+        result when a workbook with identical bytes was parsed for the same sheet.
+        """
+        from parsers.excel_parser import extract_questions_for_interactive
+
+        sheet_name = sheet_name or None
+        digest = content_digest(fileobj)
+        result = self.get_parsed(digest, sheet_name)
+        if result is None:
+            result = extract_questions_for_interactive(fileobj, sheet_name)
+            self.set_parsed(digest, sheet_name, result)
+        return result
+    
     def clear(self) -> None:
         """Clear cached data"""
         self._data = None
+        with self._lock:
+            self._parsed.clear()
         print("🗑️  Cache cleared")
 
-# Global cache instance
+# Global cache instance; import this rather than constructing another
 questionnaire_cache = QuestionnaireCache()
\ No newline at end of file
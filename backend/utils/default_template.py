@@ -0,0 +1,125 @@
+# backend/utils/default_template.py
+import functools
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from utils.serialization import loads
+
+DEFAULT_SHEETS = ["Textile_revised", "Fertilizer_revised", "Packaging_revised"]
+
+# Pre-parsed copy of final.xlsx, regenerated with: python -m utils.default_template
+PREBUILT_NAME = "final.prebuilt.json"
+# Bump when the layout of the prebuilt JSON itself changes
+PREBUILT_FORMAT = 2
+
+# Resolved once at import relative to this module, so lookups don't depend on the
+# working directory; only the first load touches the filesystem after that
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BACKEND_DIR, "data")
+# Any edit to the parser makes the prebuilt JSON stale, since its output may differ
+PARSER_FILE = os.path.join(BACKEND_DIR, "parsers", "excel_parser.py")
+DEFAULT_FILE: Optional[str] = os.path.join(DATA_DIR, "final.xlsx")
+if not os.path.isfile(DEFAULT_FILE):
+    DEFAULT_FILE = None
+PREBUILT_FILE: Optional[str] = os.path.join(DATA_DIR, PREBUILT_NAME)
+if not os.path.isfile(PREBUILT_FILE):
+    PREBUILT_FILE = None
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def build_default_template(xlsx_path: str) -> Dict:
+    """Parse the default sector sheets out of the workbook"""
+    from parsers.excel_parser import extract_questions_for_interactive
+
+    all_questions = []
+    last_sector = "General"
+
+    for sheet_name in DEFAULT_SHEETS:
+        try:
+            result = extract_questions_for_interactive(xlsx_path, sheet_name)
+            if result.get("questions"):
+                all_questions.extend(result["questions"])
+                last_sector = result.get("sector", last_sector)
+        except Exception as e:
+            print(f"Warning: Could not load sheet '{sheet_name}': {str(e)}")
+            continue
+
+    return {"questions": all_questions, "sector": last_sector}
+
+
+def _load_prebuilt(xlsx_path: str) -> Optional[Dict]:
+    prebuilt = PREBUILT_FILE
+    if prebuilt is None:
+        return None
+
+    try:
+        with open(prebuilt, "rb") as f:
+            raw = f.read()
+        data = loads(raw)
+        template = {"questions": data["questions"], "sector": data["sector"]}
+        # Ignore a prebuilt file left behind by an older final.xlsx, parser or layout
+        fresh = (
+            data.get("format") == PREBUILT_FORMAT
+            and data.get("source_digest") == _file_digest(xlsx_path)
+            and data.get("parser_digest") == _file_digest(PARSER_FILE)
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        # Truncated or malformed JSON, or a file that vanished: parse the workbook instead
+        print(f"Warning: could not read {prebuilt} ({e!r}); parsing {xlsx_path} instead")
+        return None
+
+    if not fresh:
+        print(f"Warning: {prebuilt} is stale; parsing {xlsx_path} instead")
+        return None
+    return template
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_template(xlsx_path: str) -> Optional[Dict]:
+    # Runs once per process: the deployed bundle is immutable, so final.xlsx isn't
+    # re-checked per request (restart after replacing it during development)
+    if not os.path.isfile(xlsx_path):
+        return None  # removed after import
+    return _load_prebuilt(xlsx_path) or build_default_template(xlsx_path)
+
+
+def load_default_template() -> Optional[Dict]:
+    """
+    Return {"questions": [...], "sector": ...} for the bundled questionnaire,
+    or None if final.xlsx is missing. Uses the prebuilt JSON when it matches
+    the workbook and parser, and only parses the workbook otherwise. The
+    result is kept for the lifetime of the process.
+    """
+    xlsx_path = DEFAULT_FILE
+    if xlsx_path is None:
+        return None
+    return _load_default_template(xlsx_path)
+
+
+def write_prebuilt_template() -> str:
+    """Parse final.xlsx and write the prebuilt JSON next to it"""
+    xlsx_path = DEFAULT_FILE
+    if xlsx_path is None:
+        raise FileNotFoundError("final.xlsx not found")
+
+    template = build_default_template(xlsx_path)
+    template["format"] = PREBUILT_FORMAT
+    template["source_digest"] = _file_digest(xlsx_path)
+    template["parser_digest"] = _file_digest(PARSER_FILE)
+
+    out_path = os.path.join(DATA_DIR, PREBUILT_NAME)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(template, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return out_path
+
+
+if __name__ == "__main__":
+    path = write_prebuilt_template()
+    print(f"✅ Wrote {path}")
@@ -0,0 +1,7 @@
+# backend/utils/responses.py
+from fastapi import Response
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Response for an already serialized JSON body, skipping jsonable_encoder."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -0,0 +1,25 @@
+# backend/utils/serialization.py
+# JSON encoding shared by the routers, the Vercel handler and the default template.
+# Kept free of FastAPI imports: api/index.py loads it on every cold start.
+import json
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib codec
+    orjson = None
+
+
+def dumps(data) -> bytes:
+    """
+    Compact UTF-8 JSON bytes (orjson when available), written the way Starlette's
+    JSONResponse writes them. Non-string keys are allowed: calculated rows are grouped
+    by sector, which may be None ("null").
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)